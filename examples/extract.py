@@ -14,11 +14,12 @@ class MyRecord(Extractor.Dictionary.Record):
 
 
 def main(argv) -> int:
-    if len(argv) != 3:
-        print(f"Usage: {__file__} dictionary.json text.txt")
+    if len(argv) not in (3, 4):
+        print(f"Usage: {__file__} dictionary.json text.txt [processes]")
         return 1
 
-    dictionary_json, text_txt = argv[1:]
+    dictionary_json, text_txt = argv[1:3]
+    processes = int(argv[3]) if len(argv) > 3 else 1
 
     with open(dictionary_json, "r", encoding="utf-8") as json_fd:
         dictionary = {
@@ -37,11 +38,12 @@ def main(argv) -> int:
     with open(text_txt, "r", encoding="utf-8") as text_fd:
         my_text = text_fd.read()
 
-    for match in extractor.extract(my_text):
+    for match in extractor.extract(my_text, processes=processes):
         print(match)
 
     return 0
 
+
 if __name__ == "__main__":
     from sys import argv, exit
     exit(main(argv))
@@ -1,10 +1,14 @@
 from __future__ import annotations
-from typing import Iterator, Tuple, Any, Optional, Union, IO, Type, Dict
+from typing import (
+    Iterator, Tuple, Any, Optional, Union, IO, Type, Dict, List, FrozenSet)
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, is_dataclass, field
 import json
 from importlib import import_module
 from copy import copy
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 
 from pysdcxx import Bigrams
 
@@ -23,6 +27,10 @@ class Extractor:
     interface.
     (E.g. common Python `dict` implements it; but it may be implemented on top of a DB
     connector and so on...)
+    Note that the dictionary terms are read and pre-processed on construction;
+    matching works on that snapshot.
+    If the dictionary changes afterwards (e.g. the DB is updated), call
+    `reload_dictionary` to take the change into account.
     The dictionary consists of the (multi-word) terms mapped to customisable records.
     Matches provide access to the records back.
     The resulting system may therefore be used pretty straightforwardly as dictionary
@@ -88,13 +96,94 @@ class Extractor:
         record: Extractor.Dictionary.Record
         token: str
 
+    class _TermList(Dictionary):
+        """
+        Dictionary of listed terms (used to pass dictionary to worker processes)
+        """
+        def __init__(self, items: List[Tuple[str, Extractor.Dictionary.Record]]):
+            self._items = items
+
+        def items(self) -> Iterator[Tuple[str, Extractor.Dictionary.Record]]:
+            return iter(self._items)
+
     @dataclass
     class _TermRecordBigrams:
         """
         Term record and bigrams
+
+        The matching threshold and the bigrams overlap it requires are resolved
+        on (re)indexing.
         """
         record: Extractor.Dictionary.Record
-        bigrams: Bigrams
+        bigrams: Bigrams  # shared by terms of equal bigrams
+        bigram_counts: Dict[str, int]  # distinct bigrams and their counts
+        bigrams_id: int  # identifies the shared bigrams
+        threshold: float = 1.0  # resolved matching threshold
+        min_overlap: int = 0  # minimal bigrams overlap of a match
+
+    class _BigramIndex:
+        """
+        Inverted index of terms bigrams
+
+        The index maps bigrams to IDs of the terms which contain them.
+        It is used to select candidate terms for a sentence, so that the matching
+        is only attempted for terms sharing some bigrams with the sentence.
+        (Unless the term threshold is so low that it may match anywhere.)
+
+        A term only matches in a sentence sharing at least `min_overlap` of its
+        bigrams (see `Matcher.min_overlap`).
+        So, the term bigrams of total count below `min_overlap` needn't be indexed:
+        the sentence must share some of the rest anyway (prefix filtering).
+        The most frequent bigrams (contained in most terms) are left out, which
+        keeps the postings short and the candidates few.
+        """
+        def __init__(self, frequency: Dict[str, int]):
+            """
+            :param frequency: Numbers of terms containing the bigrams
+            """
+            self._frequency = frequency
+            self._postings: Dict[str, array] = {}  # bigram -> term IDs
+            self._unconditional: List[int] = []    # IDs of always-candidate terms
+            self._size = 0                         # number of terms
+
+        def add(self, bigram_counts: Dict[str, int], min_overlap: int) -> int:
+            """
+            :param bigram_counts: Term distinct bigrams and their counts
+            :param min_overlap: Minimal bigrams overlap of the term match
+            :return: Term ID
+            """
+            term_id = self._size
+            self._size += 1
+
+            if min_overlap == 0:  # may match anywhere
+                self._unconditional.append(term_id)
+                return term_id
+
+            frequency = self._frequency
+            bigrams = sorted(
+                bigram_counts, key=lambda bigram: (frequency[bigram], bigram))
+
+            left_out = 0  # most frequent bigrams of total count below min_overlap
+            while left_out + bigram_counts[bigrams[-1]] < min_overlap:
+                left_out += bigram_counts[bigrams.pop()]
+
+            for bigram in bigrams:
+                self._postings.setdefault(bigram, array('I')).append(term_id)
+
+            return term_id
+
+        def candidates(self, bigram_set: FrozenSet[str]) -> List[int]:
+            """
+            :param bigram_set: Sentence distinct bigrams
+            :return: IDs of terms which may match in the sentence (in ascending order)
+            """
+            term_ids = set(self._unconditional)
+            for bigram in bigram_set:
+                postings = self._postings.get(bigram)
+                if postings is not None:
+                    term_ids.update(postings)
+
+            return sorted(term_ids)
 
     class _JSONEncoder(json.JSONEncoder):
         def default(self, obj: Any) -> Dict[str, Any]:
@@ -129,10 +218,30 @@ class Extractor:
         :param default_threshold: Matching threshold used if no term-specific one is set
         :param kwargs: Arguments passed to `Matcher` constructor
         """
-        self.default_threshold = default_threshold
+        self._default_threshold = default_threshold
 
         self._dictionary = dictionary
         self._matcher_kwargs = kwargs
+        self._matcher = Matcher(**kwargs)
+
+        self._terms: List[Tuple[str, Extractor._TermRecordBigrams]] = []
+        self._index = Extractor._BigramIndex({})
+        self.reload_dictionary()
+
+    @property
+    def default_threshold(self) -> float:
+        """
+        :return: Matching threshold used if no term-specific one is set
+        """
+        return self._default_threshold
+
+    @default_threshold.setter
+    def default_threshold(self, threshold: float):
+        """
+        :param threshold: Matching threshold used if no term-specific one is set
+        """
+        self._default_threshold = threshold
+        self._reindex()
 
     def dictionary(self) -> Iterator[Tuple[str, Extractor.Dictionary.Record]]:
         """
@@ -140,38 +249,162 @@ class Extractor:
         """
         return self._dictionary.items()
 
-    def extract(self, text: str) -> Iterator[Extractor.Match]:
+    def reload_dictionary(self):
+        """
+        Pre-process dictionary terms
+
+        Terms are pre-processed (their bigrams computed and indexed) once, on
+        construction.
+        Call this if the dictionary is modified (terms added, removed or their
+        matching thresholds changed) afterwards.
+        """
+        shared = {}  # terms of equal bigrams (e.g. aliases) share them
+        self._terms = []
+        for term, record in self.dictionary():
+            strings = tuple(sorted(self._matcher.sequence_bigrams_strings(term)))
+            bigrams = shared.get(strings)
+            if bigrams is None:
+                bigrams = shared[strings] = (
+                    Matcher.strings_bigrams(strings),
+                    Matcher.strings_bigram_counts(strings),
+                    len(shared),
+                )
+
+            self._terms.append((term, Extractor._TermRecordBigrams(record, *bigrams)))
+
+        self._reindex()
+
+    def _reindex(self):
+        """
+        Index pre-processed terms bigrams (depends on the matching thresholds)
+        """
+        frequency: Dict[str, int] = {}
+        for _, rec_bgrms in self._terms:
+            for bigram in rec_bgrms.bigram_counts:
+                frequency[bigram] = frequency.get(bigram, 0) + 1
+
+        self._index = Extractor._BigramIndex(frequency)
+        for _, rec_bgrms in self._terms:
+            threshold = rec_bgrms.record._matching_threshold or self.default_threshold
+            min_overlap = Matcher.min_overlap(len(rec_bgrms.bigrams), threshold)
+            rec_bgrms.threshold, rec_bgrms.min_overlap = threshold, min_overlap
+            self._index.add(rec_bgrms.bigram_counts, min_overlap)
+
+    def extract(
+        self,
+        text: str,
+        processes: int = 1,
+        chunk_size: int = 1 << 20,
+    ) -> Iterator[Extractor.Match]:
         """
         Extract dictionary term matches identified in text
+
+        Sentences may be matched in parallel, by multiple worker processes.
+        Each worker pre-processes the dictionary on its own first, so parallel
+        extraction only pays off for long texts.
+        The text is passed to the workers in chunks of whole sentences, at least
+        `chunk_size` characters long (except for the last one).
+        Dictionary records and token transforms must be picklable in that case.
+        The workers are spawned (on all platforms), i.e. they import the main module
+        anew; all the script top level work (not only this call, but also loading
+        the dictionary etc.) must be guarded by `if __name__ == "__main__":`,
+        otherwise the workers fail (or repeat that work in vain).
+        Matches are produced in the same order either way.
+
         :param text: Text
+        :param processes: Number of worker processes (1 means no parallelism)
+        :param chunk_size: Minimal text chunk size passed to a worker process
         :return: Matches
         """
-        matcher = Matcher(**self._matcher_kwargs)
+        matches = self._extract_parallel(text, processes, chunk_size) \
+            if processes > 1 else self._extract_serial(text)
+
+        for term_id, begin, end, score in matches:
+            term, rec_bgrms = self._terms[term_id]
+            yield Extractor.Match(
+                term,
+                begin,
+                end,
+                score,
+                rec_bgrms.record,
+                token=text[begin:end],
+            )
+
+    def _sentence_matches(
+        self,
+        text: str,
+        begin: int,
+        end: int,
+    ) -> Iterator[Tuple[int, int, int, float]]:
+        """
+        :param text: Text
+        :param begin: Sentence begin
+        :param end: Sentence end
+        :return: [term ID, begin, end, score] tuples of the term matches in sentence
+        """
+        preprocessed = self._matcher.sentence(text, begin, end)  # preprocess sentence
+        size = len(preprocessed.bigrams())
+        matched = {}  # matches of the shared bigrams, per threshold
 
-        terms = {  # preprocess terms
-            term : Extractor._TermRecordBigrams(record, matcher.sequence_bigrams(term))
-            for term, record in self.dictionary()
-        }
+        for term_id in self._index.candidates(preprocessed.bigram_set()):  # match terms
+            rec_bgrms = self._terms[term_id][1]
+            if rec_bgrms.min_overlap > size:
+                continue  # sentence too short for the term to match
 
-        offset = 0
-        for sentence_str in matcher.sentences(text):    # split text into sentences
-            sentence = matcher.sentence(sentence_str)   # preprocess sentence
+            key = (rec_bgrms.bigrams_id, rec_bgrms.threshold)
+            matches = matched.get(key)
+            if matches is None:
+                matches = matched[key] = list(
+                    preprocessed.match(rec_bgrms.bigrams, rec_bgrms.threshold))
 
-            for term, rec_bgrms in terms.items():       # match terms
-                record, bigrams = rec_bgrms.record, rec_bgrms.bigrams
-                threshold = record._matching_threshold or self.default_threshold
+            for match in matches:
+                yield term_id, match.begin, match.end, match.score
 
-                for match in sentence.match(bigrams, threshold):
-                    yield Extractor.Match(
-                        term,
-                        match.begin + offset,
-                        match.end + offset,
-                        match.score,
-                        record,
-                        token=sentence_str[match.begin:match.end],
-                    )
+    def _extract_serial(self, text: str) -> Iterator[Tuple[int, int, int, float]]:
+        """
+        :param text: Text
+        :return: [term ID, begin, end, score] tuples of the term matches
+        """
+        for begin, end in self._matcher.sentence_spans(text):  # split into sentences
+            yield from self._sentence_matches(text, begin, end)
 
-            offset += len(sentence_str)
+    def _extract_parallel(
+        self,
+        text: str,
+        processes: int,
+        chunk_size: int,
+    ) -> Iterator[Tuple[int, int, int, float]]:
+        """
+        :param text: Text
+        :param processes: Number of worker processes
+        :param chunk_size: Minimal text chunk size passed to a worker process
+        :return: [term ID, begin, end, score] tuples of the term matches
+        """
+        def chunks() -> Iterator[Tuple[str, int, List[Tuple[int, int]]]]:
+            offset = 0
+            spans: List[Tuple[int, int]] = []
+            for begin, end in self._matcher.sentence_spans(text):
+                spans.append((begin - offset, end - offset))
+
+                if end - offset >= chunk_size:
+                    yield text[offset:end], offset, spans
+                    offset, spans = end, []
+
+            if spans:
+                yield text[offset:], offset, spans
+
+        with ProcessPoolExecutor(
+            processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                [(term, rec_bgrms.record) for term, rec_bgrms in self._terms],
+                self.default_threshold,
+                self._matcher_kwargs,
+            ),
+        ) as executor:
+            for matches in executor.map(_extract_chunk, chunks()):
+                yield from matches
 
     def serialise(self, dump: Union[str, IO]):
         """
@@ -204,30 +437,65 @@ class Extractor:
             inst._matching_threshold = threshold
             return inst
 
-        def reconstruct(obj: Any) -> Any:
-            if isinstance(obj, dict):
-                class_name = obj.get("_class")
-                if class_name:  # the object supports deserialisation from data members
-                    del obj["_class"]
-                    module_name, class_name = class_name.split('::', 1)
-                    return instantiate(
-                        get_class(import_module(module_name), class_name),
-                        obj)
+        def reconstruct(obj: Dict[str, Any]) -> Any:
+            # JSON objects are passed bottom-up by the decoder, members come first
+            class_name = obj.get("_class")
+            if not class_name:  # plain dict
+                return obj
 
-                # Otherwise reconstruct dict values to depth
-                return {key: reconstruct(value) for key, value in obj.items()}
+            # The object supports deserialisation from data members
+            del obj["_class"]
+            obj_class = classes.get(class_name)
+            if obj_class is None:  # resolved once per class
+                module_name, name = class_name.split('::', 1)
+                obj_class = get_class(import_module(module_name), name)
+                classes[class_name] = obj_class
 
-            elif isinstance(obj, list):  # reconstruct list to depth
-                return [reconstruct(item) for item in obj]
+            return instantiate(obj_class, obj)
 
-            else:  # keep value as is
-                return obj
+        classes: Dict[str, Type] = {}
 
         with open(dump, "r", encoding="utf-8") if isinstance(dump, str) else dump as fd:
-             config = json.load(fd)
+             config = json.load(fd, object_hook=reconstruct)
 
         return cls(
-            dictionary=reconstruct(config["dictionary"]),
+            dictionary=config["dictionary"],
             default_threshold=config["default_threshold"],
-            **reconstruct(config["matcher_arguments"]),
+            **config["matcher_arguments"],
         )
+
+
+_worker_extractor: Optional[Extractor] = None  # parallel extraction worker extractor
+
+
+def _init_worker(
+    terms: List[Tuple[str, Extractor.Dictionary.Record]],
+    default_threshold: float,
+    matcher_kwargs: Dict[str, Any],
+):
+    """
+    Initialise parallel extraction worker process (pre-process the dictionary)
+    :param terms: Dictionary items
+    :param default_threshold: Matching threshold used if no term-specific one is set
+    :param matcher_kwargs: Arguments passed to `Matcher` constructor
+    """
+    global _worker_extractor
+    _worker_extractor = Extractor(
+        Extractor._TermList(terms), default_threshold, **matcher_kwargs)
+
+
+def _extract_chunk(
+    chunk: Tuple[str, int, List[Tuple[int, int]]],
+) -> List[Tuple[int, int, int, float]]:
+    """
+    Extract matches in text chunk (in a worker process)
+    :param chunk: Chunk text, its position in the text and its sentences spans
+    :return: [term ID, begin, end, score] tuples of the term matches
+    """
+    text, offset, spans = chunk
+    return [
+        (term_id, begin + offset, end + offset, score)
+        for sentence_begin, sentence_end in spans
+        for term_id, begin, end, score in _worker_extractor._sentence_matches(
+            text, sentence_begin, sentence_end)
+    ]
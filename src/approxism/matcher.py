@@ -1,7 +1,9 @@
 from __future__ import annotations
-from typing import List, ClassVar, Union, Optional, Iterator, Iterable
+from typing import (
+    List, ClassVar, Union, Optional, Iterator, Iterable, FrozenSet, Tuple, Dict)
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from math import ceil
 
 from pysdcxx import Bigrams, SequenceMatcher
 
@@ -34,6 +36,7 @@ class Matcher:
         """
         tokens: List[Tokeniser.Token]
         matcher: SequenceMatcher
+        bigrams: Bigrams = field(default_factory=Bigrams)  # all tokens bigrams
 
     class TokenTransform(ABC):
         """
@@ -48,7 +51,12 @@ class Matcher:
             tokens: Iterable[Tokeniser.Token],
         ) -> Iterator[Tokeniser.Token]:
             """
-            :param sequence: Original sequence
+            Sentences of a text are tokenised in place, i.e. `sequence` is the whole
+            string (e.g. text) and the tokens may only cover its part (a sentence).
+            Token positions are relative to `sequence`, so the token original
+            string is always `sequence[token.begin:token.end]`.
+
+            :param sequence: Original string
             :param tokens: Sequence tokens
             :return: Transformed tokens
             """
@@ -57,32 +65,61 @@ class Matcher:
         """
         Pre-processed text
         """
-        def __init__(self, matcher: Matcher, text: str, split_sentences: bool):
+        def __init__(
+            self,
+            matcher: Matcher,
+            text: str,
+            spans: Iterable[Tuple[int, int]],
+        ):
             """
+            Sentences are tokenised in place, token positions are relative to `text`
             :param matcher: Matcher
             :param text: Text
-            :param split_sentences: Do sentence splitting
+            :param spans: [begin, end] spans of the text sentences
             """
             self._matcher = matcher
             self._sentences : List[Matcher.TokenSequence] = []
 
-            sentences = self._matcher.sentences(text) if split_sentences else (text,)
+            for begin, end in spans:
+                tokens: List[Tokeniser.Token] = []
+                bigrams_strip: List[Tuple[Bigrams, bool]] = []
+                sentence_bigrams = Bigrams()
+
+                for token, token_bigrams, strip in self._matcher.annotated_tokens(
+                    text, begin, end):  # tokenised in place
+                    tokens.append(token)
+                    bigrams_strip.append((token_bigrams, strip))
+                    sentence_bigrams += token_bigrams
+
+                self._sentences.append(Matcher.TokenSequence(
+                    tokens=tokens,
+                    matcher=SequenceMatcher(bigrams_strip),  # space reserved at once
+                    bigrams=sentence_bigrams,
+                ))
 
-            offset = 0
-            for sentence in sentences:
-                token_seq = Matcher.TokenSequence(tokens=[], matcher=SequenceMatcher())
+        def bigrams(self) -> Bigrams:
+            """
+            Note that bigrams multiset of any match is a subset of the text bigrams
+            :return: Text bigrams (union of all tokens bigrams)
+            """
+            if len(self._sentences) == 1:
+                return self._sentences[0].bigrams
+
+            bigrams = Bigrams()
+            for sentence in self._sentences:
+                bigrams += sentence.bigrams  # in place
 
-                for token in self._matcher.tokenise(sentence):
-                    token.begin += offset
-                    token.end += offset
-                    token_seq.tokens.append(token)
-                    token_seq.matcher.append(
-                        self._matcher.token_bigrams(token),
-                        strip=self._matcher.is_strip_token(token),
-                    )
+            return bigrams
 
-                self._sentences.append(token_seq)
-                offset += len(sentence)
+        def bigram_set(self) -> FrozenSet[str]:
+            """
+            :return: Set of (distinct) text bigrams
+            """
+            return Matcher.strings_bigram_set(
+                self._matcher.token_bigrams_string(token)
+                for sentence in self._sentences
+                for token in sentence.tokens
+            )
 
         def match(
             self,
@@ -99,13 +136,22 @@ class Matcher:
                 if isinstance(string, str) else string
             assert isinstance(bigrams, Bigrams)
 
+            def make_match(
+                tokens: List[Tokeniser.Token],
+                match: SequenceMatcher.Match,
+            ) -> Matcher.Match:
+                return Matcher.Match(
+                    tokens[match.begin].begin, tokens[match.end - 1].end, match.score)
+
+            min_overlap = Matcher.min_overlap(len(bigrams), threshold)
+
             for sentence in self._sentences:
-                def make_match(match: SequenceMatcher.Match) -> Matcher.Match:
-                    return Matcher.Match(
-                        begin=sentence.tokens[match.begin].begin,
-                        end=sentence.tokens[match.end - 1].end,
-                        score=match.score,
-                    )
+                # Match bigrams are a subset of the sentence bigrams, so the sentence
+                # may be skipped right away if their intersection is too small
+                # (no need to compute it if any overlap will do)
+                if min_overlap and \
+                        Bigrams.intersect_size(bigrams, sentence.bigrams) < min_overlap:
+                    continue
 
                 best_match: Optional[SequenceMatcher.Match] = None  # best overlap
 
@@ -114,7 +160,7 @@ class Matcher:
                         pass  # ... we shall register this one as the best for now
 
                     elif not match.begin < best_match.end:  # past last match overlaps
-                        yield make_match(best_match)
+                        yield make_match(sentence.tokens, best_match)
 
                     elif match.score <= best_match.score:  # worse overlap found...
                         continue  # ... keep the better one
@@ -122,7 +168,7 @@ class Matcher:
                     best_match = match  # found (better) overlaping match
 
                 if best_match:  # produce last best match
-                    yield make_match(best_match)
+                    yield make_match(sentence.tokens, best_match)
 
     default_language = "english"
 
@@ -157,14 +203,27 @@ class Matcher:
         :param string: Text in which to search (in string form)
         :return: Pre-processed text (split into tokenised sentences, bigrams computed)
         """
-        return Matcher.Text(self, string, split_sentences=True)
+        return Matcher.Text(self, string, self.sentence_spans(string))
 
-    def sentence(self, string: str) -> Matcher.Text:
+    def sentence(
+        self,
+        string: str,
+        begin: int = 0,
+        end: Optional[int] = None,
+    ) -> Matcher.Text:
         """
+        Only `string[begin:end]` is pre-processed, yet match positions are relative
+        to the whole `string`.
+
         :param string: Sentence in hich to search (in string form)
+        :param begin: Sentence begin
+        :param end: Sentence end (default: end of the string)
         :return: Pre-processed sentence (tokenised, bigrams computed)
         """
-        return Matcher.Text(self, string, split_sentences=False)
+        if end is None:
+            end = len(string)
+
+        return Matcher.Text(self, string, ((begin, end),))
 
     def sentences(self, text: str) -> Iterator[str]:
         """
@@ -173,16 +232,69 @@ class Matcher:
         """
         return self._tokeniser.sentences(text)
 
-    def tokenise(self, string: str) -> Iterator[Tokeniser.Token]:
+    def sentence_spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        :param text: Text string
+        :return: [begin, end] spans of the sentences in the text
+        """
+        return self._tokeniser.sentence_spans(text)
+
+    def tokenise(
+        self,
+        string: str,
+        begin: int = 0,
+        end: Optional[int] = None,
+    ) -> Iterator[Tokeniser.Token]:
         """
+        Tokenise `string[begin:end]` (token positions are relative to `string`)
         :param string: String of tokens
+        :param begin: Tokenised substring begin
+        :param end: Tokenised substring end (default: end of the string)
         :return: Iterator of [token, begin, end, tag]
         """
-        tokens = self._tokeniser.tokenise(string)
+        tokens = self._tokeniser.tokenise(string, begin, end)
         for transform in self._transform:
             tokens = transform.transform(string, tokens)
         return tokens
 
+    def annotated_tokens(
+        self,
+        string: str,
+        begin: int = 0,
+        end: Optional[int] = None,
+    ) -> Iterator[Tuple[Tokeniser.Token, Bigrams, bool]]:
+        """
+        Tokenise `string[begin:end]` and provide the tokens bigrams and strip flags
+
+        This is the same as calling `token_bigrams` and `is_strip_token` for each
+        token, but done in one pass (the text pre-processing hot loop).
+
+        :param string: String of tokens
+        :param begin: Tokenised substring begin
+        :param end: Tokenised substring end (default: end of the string)
+        :return: Iterator of [token, token bigrams, token is a strip token]
+        """
+        # Inlined `token_bigrams_string` (calling it per token costs ~5% of the
+        # extraction time); keep the two in sync
+        word_tag, ws_tag = Tokeniser.word, Tokeniser.ws
+        stopwords, omit_whitespaces = self._stopwords, self._omit_whitespaces
+
+        for token in self.tokenise(string, begin, end):
+            token_string, tag = token.string, token.tag
+
+            if tag == word_tag:
+                strip = token_string in stopwords
+            elif tag == ws_tag and omit_whitespaces:
+                yield token, Bigrams(), True
+                continue
+            else:
+                strip = True
+
+            if len(token_string) == 1:  # don't drop single char tokens
+                token_string = f"{token_string} "
+
+            yield token, Bigrams(token_string), strip
+
     def is_strip_token(self, token: Tokeniser.Token) -> bool:
         """
         :param token: Token
@@ -190,24 +302,33 @@ class Matcher:
         """
         return token.tag != Tokeniser.word or token.string in self._stopwords
 
-    def token_bigrams(self, token: Tokeniser.Token) -> Bigrams:
+    def token_bigrams_string(self, token: Tokeniser.Token) -> str:
         """
         :param token: Token
-        :return: Token bigrams
+        :return: String of which the token bigrams are made (may be empty)
         """
+        # NOTE: `annotated_tokens` inlines this; keep the two in sync
         if token.tag == Tokeniser.ws and self._omit_whitespaces:
-            return Bigrams()
+            return ""
 
         token_string = token.string
         if len(token_string) == 1:  # don't drop single char tokens
             token_string = f"{token_string} "
 
-        return Bigrams(token_string)
+        return token_string
 
-    def sequence_bigrams(self, string: str) -> Bigrams:
+    def token_bigrams(self, token: Tokeniser.Token) -> Bigrams:
+        """
+        :param token: Token
+        :return: Token bigrams
+        """
+        return Bigrams(self.token_bigrams_string(token))
+
+    def sequence_bigrams_strings(self, string: str) -> List[str]:
         """
+        Bigrams of sequences of the same strings (in any order) are the same
         :param string: String of tokens
-        :return: Token sequence bigrams
+        :return: Strings of which the token sequence bigrams are made (non-empty)
         """
         tokens = list(self.tokenise(string))
         while len(tokens) and self.is_strip_token(tokens[0]):
@@ -215,7 +336,74 @@ class Matcher:
         while len(tokens) and self.is_strip_token(tokens[-1]):
             tokens.pop(-1)
 
-        return sum(
-            (self.token_bigrams(token) for token in tokens),
-            start=Bigrams(),
+        return [
+            bigrams_string
+            for bigrams_string in map(self.token_bigrams_string, tokens)
+            if bigrams_string
+        ]
+
+    @staticmethod
+    def strings_bigrams(strings: Iterable[str]) -> Bigrams:
+        """
+        :param strings: Strings (e.g. from `sequence_bigrams_strings`)
+        :return: Union of the strings bigrams
+        """
+        bigrams = Bigrams()
+        for string in strings:
+            bigrams += Bigrams(string)  # in place (no copying)
+
+        return bigrams
+
+    @staticmethod
+    def strings_bigram_set(strings: Iterable[str]) -> FrozenSet[str]:
+        """
+        Computed directly from the strings, as iterating `Bigrams` is relatively slow
+        :param strings: Strings (e.g. from `sequence_bigrams_strings`)
+        :return: Set of (distinct) bigrams of the strings
+        """
+        return frozenset(
+            string[i:i + 2]
+            for string in strings
+            for i in range(len(string) - 1)
         )
+
+    @staticmethod
+    def strings_bigram_counts(strings: Iterable[str]) -> Dict[str, int]:
+        """
+        Computed directly from the strings, as iterating `Bigrams` is relatively slow
+        :param strings: Strings (e.g. from `sequence_bigrams_strings`)
+        :return: Distinct bigrams of the strings and their counts
+        """
+        counts: Dict[str, int] = {}
+        for string in strings:
+            for i in range(len(string) - 1):
+                bigram = string[i:i + 2]
+                counts[bigram] = counts.get(bigram, 0) + 1
+
+        return counts
+
+    def sequence_bigrams(self, string: str) -> Bigrams:
+        """
+        :param string: String of tokens
+        :return: Token sequence bigrams
+        """
+        return Matcher.strings_bigrams(self.sequence_bigrams_strings(string))
+
+    @staticmethod
+    def min_overlap(size: int, threshold: float) -> int:
+        """
+        Sørensen–Dice coefficient of pattern bigrams A and match bigrams B is
+        2|A∩B| / (|A| + |B|), and since |B| >= |A∩B|, the coefficient may only reach
+        threshold t if |A∩B| >= t|A| / (2 - t).
+
+        The intersection can't exceed |A|; thresholds of 1 and above (where only
+        an exact match or no match at all is possible) therefore require |A|.
+
+        :param size: Pattern bigrams multiset size
+        :param threshold: Matching score threshold
+        :return: Minimal size of bigrams intersection allowing for a match
+        """
+        if threshold >= 1.0:
+            return size
+
+        return max(ceil(threshold * size / (2 - threshold) - 1e-9), 0)
@@ -1,22 +1,43 @@
 from typing import List
 from pathlib import Path
 from glob import glob
+from sys import intern
+from functools import lru_cache
 
 
-class Stopwords(set):
+class Stopwords(frozenset):
     """
     Stopwords set
+
+    The set is immutable and therefore shared; each language stopwords are only
+    loaded once.
     """
 
     data_dir = f"{Path(__file__).parent}/stopwords"
 
-    def __init__(self, language: str = "english"):
+    def __new__(cls, language: str = "english"):
         """
         :param language: Language
         """
+        return cls._load(language)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _load(cls, language: str):
+        """
+        :param language: Language
+        :return: Stopwords set
+        """
         stopwords_txt = f"{Stopwords.data_dir}/{language}.txt"
         with open(stopwords_txt, "r", encoding="utf-8") as stopwords_fd:
-            super().__init__(word.strip() for word in stopwords_fd)
+            stopwords = super().__new__(
+                cls, (intern(word.strip()) for word in stopwords_fd))
+
+        stopwords.language = language
+        return stopwords
+
+    def __reduce__(self):
+        return self.__class__, (self.language,)
 
     @staticmethod
     def available() -> List[str]:
@@ -29,7 +50,7 @@ class Stopwords(set):
         ]
 
 
-class NoStopwords(set):
+class NoStopwords(frozenset):
     """
     Empty set of stopwords
     """
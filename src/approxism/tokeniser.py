@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Set, ClassVar, Iterator
+from typing import (
+    FrozenSet, ClassVar, Iterator, Optional, Tuple, List, TYPE_CHECKING)
 from dataclasses import dataclass
 from string import whitespace, punctuation
 from unicodedata import category as unicode_category
@@ -8,24 +9,48 @@ import re
 from glob import glob
 from pathlib import Path
 from os import environ
+from functools import lru_cache
+from itertools import starmap
 
-from nltk.data import load as nltk_load
-from nltk import download as nltk_download
-from nltk.tokenize.punkt import PunktSentenceTokenizer
 from filelock import FileLock
 
+# NLTK takes quite some time to import; it's only imported when punkt is needed
+if TYPE_CHECKING:
+    from nltk.tokenize.punkt import PunktSentenceTokenizer
 
-def punctuation_chars() -> Set[str]:
+
+punctuation_txt = f"{Path(__file__).parent}/punctuation.txt"
+
+
+@lru_cache(maxsize=None)
+def unicode_punctuation_chars() -> FrozenSet[str]:
     """
-    :return: Punctuation characters
+    Going through all the code points takes quite some time; that's why the result
+    is pre-computed in `punctuation_txt` (one character per line).
+    Run this module as a script (`python -m approxism.tokeniser`) to re-generate
+    the table.
+    :return: Characters of Unicode punctuation categories
     """
-    chars = {
+    return frozenset(
         char for char_code in range(maxunicode + 1)
         if unicode_category(char := chr(char_code))[0] == 'P'
-    }
+    )
+
+
+def punctuation_chars() -> FrozenSet[str]:
+    """
+    If the pre-computed table is missing, the characters are computed
+    :return: Punctuation characters
+    """
+    try:
+        with open(punctuation_txt, "r", encoding="utf-8") as punctuation_fd:
+            chars = {line.rstrip("\n") for line in punctuation_fd}
+    except FileNotFoundError:
+        chars = set(unicode_punctuation_chars())
+
     chars.update(set(punctuation))
     chars -= set("'’")
-    return chars
+    return frozenset(chars)
 
 
 class Tokeniser:
@@ -57,20 +82,44 @@ class Tokeniser:
     Therefore, even parallel usage of the library should be safe and correct.
     """
 
-    @dataclass
+    @dataclass(eq=False)
     class Token:
         """
         Token
+
+        Tokens are created in great numbers; slots save memory and attribute access.
+        Tokens are hashed by their position; don't move tokens stored in sets
+        or used as dict keys.
         """
+        __slots__ = ("string", "begin", "end", "tag")
+
         string: str
         begin: int
         end: int
         tag: str
 
+        def __eq__(self, other: object) -> bool:
+            if other.__class__ is not self.__class__:
+                return NotImplemented
+
+            # Compare positions first, they differ the most
+            return self.begin == other.begin and self.end == other.end \
+                and self.string == other.string and self.tag == other.tag
+
+        def __hash__(self) -> int:
+            return hash((self.begin, self.end))
+
     _punctuation = punctuation_chars()
-    _whitespaces = set(whitespace)
-    _split_chars = "".join(_punctuation) + "".join(_whitespaces)
-    _word_re = re.compile(rf"[^{re.escape(_split_chars)}]+")
+    _whitespaces = frozenset(whitespace)
+
+    # Split characters are translated to spaces before words lookup.
+    # That's much faster than matching a character class of all the split characters.
+    _split_table = {ord(char): " " for char in _punctuation | _whitespaces}
+    _word_re = re.compile(r"[^ ]+")
+
+    # ASCII strings (the common case) are split by a small character class directly
+    _ascii_word_re = re.compile("[^%s]+" % re.escape("".join(sorted(
+        chr(code) for code in _split_table if code < 128))))
 
     # Tags
     word = "word"
@@ -90,6 +139,7 @@ class Tokeniser:
 
         with FileLock(f"{Tokeniser.nltk_data_dir}/.lock"):
             if not punkt_data_dir.is_dir():  # download NLTK.punkt
+                from nltk import download as nltk_download
                 nltk_download("punkt", download_dir=Tokeniser.nltk_data_dir)
 
         assert punkt_data_dir.is_dir()
@@ -99,47 +149,105 @@ class Tokeniser:
         :param language: Language
         :param default: Default language to use if requested language is not available
         """
+        self._punkt = Tokeniser.punkt_model(language)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def punkt_model(language: str) -> PunktSentenceTokenizer:
+        """
+        The models are loaded once per language and shared by the tokenisers
+        :param language: Language
+        :return: NLTK.punkt sentence tokeniser model
+        """
+        from nltk.data import load as nltk_load
+
         Tokeniser.assert_punkt_models()
-        self._punkt = nltk_load(f"{Tokeniser.punkt_data_dir}/{language}.pickle")
+        return nltk_load(f"{Tokeniser.punkt_data_dir}/{language}.pickle", cache=False)
 
-    def sentences(self, text: str) -> Iterator[str]:
+    def sentence_spans(self, text: str) -> Iterator[Tuple[int, int]]:
         """
+        Sentences leading white spaces are included, so the spans cover the text
         :param text: Text string
-        :return: Sentences in the text
+        :return: [begin, end] spans of the sentences in the text
         """
         begin = 0
-        for sentence in self._punkt.tokenize(text):
-            end = text.index(sentence, begin) + len(sentence)
-            yield text[begin:end]
+        for _, end in self._punkt.span_tokenize(text):  # no need to search for them
+            yield begin, end
             begin = end
 
-    def tokenise(self, string: str) -> Iterator[Tokeniser.Token]:
+    def sentences(self, text: str) -> Iterator[str]:
+        """
+        :param text: Text string
+        :return: Sentences in the text
+        """
+        for begin, end in self.sentence_spans(text):
+            yield text[begin:end]  # leading white spaces included
+
+    def tokenise(
+        self,
+        string: str,
+        begin: int = 0,
+        end: Optional[int] = None,
+    ) -> Iterator[Tokeniser.Token]:
         """
+        Only `string[begin:end]` is tokenised, yet token positions are relative
+        to the whole `string`.
+        This allows for tokenisation of text sentences without offset adjustments.
+
         :param string: String of tokens
+        :param begin: Tokenised substring begin
+        :param end: Tokenised substring end (default: end of the string)
         :return: Iterator of [token, begin, end, tag]
         """
+        return starmap(Tokeniser.Token, self.tokenise_raw(string, begin, end))
+
+    def tokenise_raw(
+        self,
+        string: str,
+        begin: int = 0,
+        end: Optional[int] = None,
+    ) -> Iterator[Tuple[str, int, int, str]]:
+        """
+        Same as `tokenise`, but tokens are plain tuples (no objects constructed)
+        :param string: String of tokens
+        :param begin: Tokenised substring begin
+        :param end: Tokenised substring end (default: end of the string)
+        :return: Iterator of (token, begin, end, tag) tuples
+        """
         def split_tag(token: str) -> str:
-            for char in token:
-                if char in Tokeniser._punctuation:
-                    return Tokeniser.punct
-            return Tokeniser.ws
+            # Split tokens only consist of white spaces and punctuation
+            # (no punctuation character is a white space)
+            return ws_tag if token.isspace() else punct_tag
 
-        offset = 0
-        for match in re.finditer(Tokeniser._word_re, string):
-            begin, end = match.span()
+        if end is None:
+            end = len(string)
 
-            if offset < begin:   # split token
-                token = string[offset:begin]
-                yield Tokeniser.Token(
-                    token, begin=offset, end=begin, tag=split_tag(token))
+        substring = string[begin:end]
+        if substring.isascii():  # fast path, no translation
+            words = Tokeniser._ascii_word_re.finditer(substring)
+        else:  # split chars translation is 1:1 so positions are kept
+            normalised = substring.translate(Tokeniser._split_table)
+            words = Tokeniser._word_re.finditer(normalised)
 
-            yield Tokeniser.Token(match.group(), begin, end, tag=Tokeniser.word)
-            offset = end
+        # The loop runs per token; avoid attribute lookups
+        word_tag, ws_tag, punct_tag = Tokeniser.word, Tokeniser.ws, Tokeniser.punct
 
-        if offset < len(string):  # trailing split token
-            token = string[offset:]
-            yield Tokeniser.Token(
-                token, begin=offset, end=len(string), tag=split_tag(token))
+        offset = begin
+        for match in words:
+            word_begin, word_end = match.span()
+            word_begin += begin
+            word_end += begin
+
+            if offset < word_begin:  # split token
+                token = string[offset:word_begin]
+                yield token, offset, word_begin, split_tag(token)
+
+            yield string[word_begin:word_end], word_begin, word_end, word_tag
+            offset = word_end
+
+        if offset < end:  # trailing split token
+            token = string[offset:end]
+            yield token, offset, end, split_tag(token)
 
     @staticmethod
     def available() -> List[str]:
@@ -151,3 +259,10 @@ class Tokeniser:
             Path(pickle).stem
             for pickle in glob(f"{Tokeniser.punkt_data_dir}/*.pickle")
         ]
+
+
+if __name__ == "__main__":
+    # Generate the punctuation characters table
+    with open(punctuation_txt, "w", encoding="utf-8") as punctuation_fd:
+        for char in sorted(unicode_punctuation_chars()):
+            print(char, file=punctuation_fd)
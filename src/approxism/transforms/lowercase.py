@@ -35,17 +35,19 @@ class Lowercase(Matcher.TokenTransform):
         :param tokens: Sequence tokens
         :return: Tokens (all words lowercased)
         """
-        for token in tokens:
-            while True:  # pragmatic loop allowing for breaks
-                if token.tag != Tokeniser.word: break  # don't lowercase non-words
+        word_tag, min_len, except_caps = Tokeniser.word, self.min_len, self.except_caps
 
-                if len(token.string) < self.min_len:  # short word
-                    if not self.except_caps: break  # keep as is
+        for token in tokens:
+            string = token.string
 
-                    if token.string.upper() == token.string:
-                        break  # all CAPS, keep as is
+            if token.tag != word_tag or string.islower():  # nothing to lowercase
+                yield token
+                continue
 
-                token.string = token.string.lower()  # lowercase
-                break  # end of pragmatic loop
+            if len(string) < min_len:  # short word
+                if not except_caps or string.isupper():  # keep as is
+                    yield token
+                    continue
 
+            token.string = string.lower()  # lowercase
             yield token
@@ -209,6 +209,77 @@ def test_extraction():
     assert all(text[match.begin:match.end] == match.token for match in matches)
 
 
+def test_parallel_extraction():
+    extractor = Extractor(dictionary, default_threshold=0.8)
+
+    serial = list(extractor.extract(text))
+    parallel = list(extractor.extract(text, processes=2, chunk_size=100))
+    assert parallel == serial
+    assert all(  # records are the dictionary ones, not copies
+        match.record is dictionary[match.term] for match in parallel)
+
+
+def test_reload_dictionary():
+    my_dictionary = {"Kryten" : dictionary["Kryten"]}
+    extractor = Extractor(my_dictionary)
+
+    assert [match.term for match in extractor.extract(text)] == ["Kryten"]
+
+    my_dictionary["Holly"] = dictionary["Holly"]
+    assert [match.term for match in extractor.extract(text)] == ["Kryten"]
+
+    extractor.reload_dictionary()
+    assert [match.term for match in extractor.extract(text)] == ["Kryten", "Holly"]
+
+    my_dictionary["Grant, Rob"] = dictionary["Grant, Rob"]
+    extractor.reload_dictionary()
+    assert [match.term for match in extractor.extract(text)] == ["Kryten", "Holly"]
+
+    extractor.default_threshold = 0.9  # "Rob Grant" scores 2*6/(7+6) == ~0.923
+    assert [match.term for match in extractor.extract(text)] == [
+        "Grant, Rob", "Kryten", "Holly",
+    ]
+
+
+def test_shared_bigrams():
+    my_dictionary = {
+        "Kryten" : dictionary["Kryten"],
+        "KRYTEN" : dictionary["Kryten"],
+        "Holly" : dictionary["Holly"],
+    }
+    extractor = Extractor(my_dictionary, token_transform=[Lowercase()])
+
+    terms = extractor._terms
+    assert terms[0][1].bigrams is terms[1][1].bigrams
+    assert terms[0][1].bigrams_id == terms[1][1].bigrams_id
+    assert terms[0][1].bigrams_id != terms[2][1].bigrams_id
+
+    assert [match.term for match in extractor.extract(text)] == [
+        "Kryten", "KRYTEN", "Holly",
+    ]
+
+
+def test_bigram_index():
+    index = Extractor._BigramIndex({"ab" : 1, "bc" : 2, "cd" : 3, "de" : 3})
+    assert index.add({"ab" : 1, "bc" : 1, "cd" : 1}, min_overlap=2) == 0
+    assert index.add({"bc" : 1, "cd" : 1, "de" : 2}, min_overlap=3) == 1
+    assert index.add({"cd" : 1, "de" : 1}, min_overlap=0) == 2
+
+    # The most frequent bigrams of total count below min_overlap aren't indexed
+    assert index.candidates(frozenset(["cd"])) == [1, 2]
+    assert index.candidates(frozenset(["de"])) == [2]
+    assert index.candidates(frozenset(["bc"])) == [0, 1, 2]
+    assert index.candidates(frozenset(["ab", "de"])) == [0, 2]
+
+
+def test_unreachable_threshold():
+    my_dictionary = {"Kryten" : dictionary["Kryten"]}  # no term-specific threshold
+    assert [match.term for match in Extractor(my_dictionary).extract(text)] == [
+        "Kryten",
+    ]
+    assert list(Extractor(my_dictionary, default_threshold=1.5).extract(text)) == []
+
+
 def test_serialisation(tmpdir):
     extractor = Extractor(
         dictionary,
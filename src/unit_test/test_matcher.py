@@ -27,6 +27,11 @@ def test_default():
         Matcher.Match(55, 69, 2*7/(10+11)),     # 4 bigrams lost: te en nc es
     ]
 
+    sentence = matcher.sentence(
+        "First test sentence.  Second test sentence. Such great test sentences.",
+        20, 43)
+    assert list(sentence.match(bgr, 0.65)) == [Matcher.Match(29, 42, 2*7/(10+10))]
+
 
 def test_lowercase():
     #      0         1         2         3         4         5         6         7
@@ -100,3 +105,27 @@ def test_strict_language():
         Matcher("martian")
 
     assert Matcher("martian", strict_language=False)  # a fallback will do (Neptunian?)
+
+
+def test_strings_bigram_counts():
+    matcher = Matcher()
+    for string in ("Hello world!", "a cat", "Sørensen–Dice coefficient", "the end"):
+        assert Matcher.strings_bigram_counts(matcher.sequence_bigrams_strings(string)) \
+            == dict(matcher.sequence_bigrams(string))
+
+    strings = matcher.sequence_bigrams_strings("a cat")  # "a" is a stop word
+    assert Matcher.strings_bigram_counts(strings) == {"ca" : 1, "at" : 1}
+
+
+def test_min_overlap():
+    assert Matcher.min_overlap(3, 0.85) == 3  # 2*2/(3+2) == 0.8 < 0.85
+    assert Matcher.min_overlap(3, 0.8) == 2   # 2*2/(3+2) == 0.8
+    assert Matcher.min_overlap(10, 1.0) == 10
+    assert Matcher.min_overlap(10, 0.0) == 0
+    assert Matcher.min_overlap(10, 1.5) == 10  # no match possible
+    assert Matcher.min_overlap(10, 2.0) == 10
+
+    matcher = Matcher()
+    text = matcher.text("First sentence.  Second one, about the world.")
+    assert list(text.match("worl", 0.85)) == [Matcher.Match(39, 44, 2*3/(4+3))]
+    assert list(text.match("world", 2.0)) == []
@@ -20,3 +20,8 @@ def test_available():
 
 def test_no_stopwords():
     assert len(NoStopwords()) == 0
+
+
+def test_shared():
+    assert Stopwords("czech") is Stopwords("czech")
+    assert Stopwords("czech") is not Stopwords("german")
@@ -1,6 +1,8 @@
 from string import punctuation
+from unicodedata import category as unicode_category
 
 from approxism import Tokeniser
+from approxism import tokeniser
 from approxism.tokeniser import punctuation_chars
 
 
@@ -13,6 +15,25 @@ def test_punctuation_chars():
     # Check a few UNICODE punct. chars...
     assert all(ch in punct_chars for ch in "“”¿¡")
 
+    # Split tokens tagging relies on that
+    assert not any(ch.isspace() for ch in punct_chars)
+
+
+def test_punctuation_table():
+    punct_chars = punctuation_chars()
+
+    # The table may be of another Unicode version; only check the chars known here
+    assert all(
+        unicode_category(ch)[0] == "P" or ch in punctuation
+        for ch in punct_chars if unicode_category(ch) != "Cn"
+    )
+
+
+def test_punctuation_fallback(monkeypatch, tmpdir):
+    monkeypatch.setattr(tokeniser, "punctuation_txt", str(tmpdir/"missing.txt"))
+    assert punctuation_chars() == (
+        tokeniser.unicode_punctuation_chars() | set(punctuation)) - set("'’")
+
 
 def test_available():
     available = Tokeniser.available()
@@ -26,6 +47,7 @@ def test_sentences():
         "  This is a test text, it should be split.",
         " All done, good bye!",
     ]
+    assert list(Tokeniser().sentence_spans(text)) == [(0, 12), (12, 54), (54, 74)]
 
 
 def test_tokenise():
@@ -45,3 +67,72 @@ def test_tokenise():
         Tokeniser.Token("clue",     23, 27, Tokeniser.word),
         Tokeniser.Token(".",        27, 28, Tokeniser.punct),
     ]
+
+
+def test_split_tags():
+    tokeniser = Tokeniser()
+    for string in ("a , b", "a „b“ c", "a\t…\n b"):  # ws first, ASCII and not
+        assert all(
+            token.tag == Tokeniser.punct
+            for token in tokeniser.tokenise(string)
+            if token.tag != Tokeniser.word
+        )
+
+
+def test_tokenise_regex_metachars():
+    for string in ("a]b\\c^d-e[f", "a]b\\c^d-e[f…"):  # ASCII and not
+        assert [
+            token.string
+            for token in Tokeniser().tokenise(string)
+            if token.tag == Tokeniser.word
+        ] == list("abcdef")
+
+
+def test_tokenise_raw():
+    string = "I'm sorry, I haven't a clue… "
+    assert list(Tokeniser().tokenise_raw(string)) == [
+        (token.string, token.begin, token.end, token.tag)
+        for token in Tokeniser().tokenise(string)
+    ]
+
+
+def test_token_slots():
+    token = Tokeniser.Token("word", 0, 4, Tokeniser.word)
+    assert not hasattr(token, "__dict__")  # slotted
+
+    token.string = "WORD"  # tokens are mutable (transforms may change them)
+    assert token == Tokeniser.Token("WORD", 0, 4, Tokeniser.word)
+    assert token != Tokeniser.Token("WORD", 0, 4, Tokeniser.punct)
+    assert token != ("WORD", 0, 4, Tokeniser.word)
+
+    tokens = {token, Tokeniser.Token("WORD", 0, 4, Tokeniser.word)}
+    assert len(tokens) == 1
+
+
+def test_tokenise_substring():
+    #          0         1         2
+    #          0123456789012345678901234
+    string = "Hello world!  Hi there."
+    assert list(Tokeniser().tokenise(string, 12, 20)) == [
+        Tokeniser.Token("  ",       12, 14, Tokeniser.ws),
+        Tokeniser.Token("Hi",       14, 16, Tokeniser.word),
+        Tokeniser.Token(" ",        16, 17, Tokeniser.ws),
+        Tokeniser.Token("the",      17, 20, Tokeniser.word),
+    ]
+
+
+def test_tokenise_ascii():
+    ascii_string = "It's 5 o'clock, isn't it?! \t(Maybe...)"
+    string = ascii_string + " Žluťoučký kůň"
+    tokeniser = Tokeniser()
+
+    ascii_tokens = list(tokeniser.tokenise(ascii_string))[:-1]  # w/o trailing ")"
+    assert ascii_tokens == list(tokeniser.tokenise(string))[:len(ascii_tokens)]
+    assert [token.tag for token in ascii_tokens if token.tag != Tokeniser.word] == [
+        Tokeniser.ws, Tokeniser.ws, Tokeniser.punct, Tokeniser.ws, Tokeniser.punct,
+    ]
+
+
+def test_shared_punkt_model():
+    assert Tokeniser()._punkt is Tokeniser("english")._punkt
+    assert Tokeniser("czech")._punkt is not Tokeniser("english")._punkt
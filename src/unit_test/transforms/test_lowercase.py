@@ -42,7 +42,9 @@ def test_except_caps():
     check({"min_len": 4, "except_caps": True}, [
         "ABCDEF", "ABCDE", "ABCD", "ABC", "AB", "A",
         "ABcdEF", "ABCde", "ABCd", "Abc", "Ab",
+        "R2", "r2", "42",
     ], [
         "abcdef", "abcde", "abcd", "ABC", "AB", "A",
         "abcdef", "abcde", "abcd", "abc", "ab",
+        "R2", "r2", "42",
     ])